@@ -0,0 +1,37 @@
+""" Benchmark of the round trip latency per waiter type (see params.waiter)
+
+Usage: python benchmarks/waiter_latency.py [number of calls]
+"""
+
+import os
+import sys
+import time
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+# pylint: disable=wrong-import-position
+from pqthreads import utils
+from pqthreads.config import params
+from pqthreads.examples import worker
+
+
+@worker.decorator_example
+def measure(calls):
+    """ Returns the mean latency (us) of attribute requests """
+    fig = worker.figure()
+    start = time.perf_counter()
+    for _ in range(calls):
+        _ = fig.title
+    latency = (time.perf_counter() - start) / calls * 1e6
+    fig.close()
+    return latency
+
+
+def main():
+    """ Measure all waiter types """
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    for waiter in utils.waiters:
+        params.waiter = waiter
+        print(f'{waiter:>10}: {measure(calls=calls):6.1f} us/call')
+
+
+if __name__ == '__main__':
+    main()
@@ -3,10 +3,12 @@ Thread communicator module for sending and receiving information from one thread
 to another using a sender and receiver
 """
 
+import itertools
 from copy import copy
 from contextlib import contextmanager
 from pqthreads.qt import QtCore
 from pqthreads import utils
+from pqthreads import futures
 from pqthreads.config import params
 
 
@@ -23,13 +25,73 @@ class GUIAgentException(RootTCException):
     """ This Exception is raised if an error at receiver side was detected """
 
 
-class WorkerAgent(QtCore.QObject):
+class AttributeCache:
+    """
+    Worker side cache of attribute values, keyed by item index and attribute
+    name. The version is incremented on every invalidation, such that values
+    requested before an invalidation aren't stored afterwards.
+    """
+    missing = object()
+
+    def __init__(self):
+        self.values = {}
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}(hits={self.hits}, misses={self.misses})'
+
+    def get(self, index, name):
+        """ Returns the cached value or AttributeCache.missing """
+        value = self.values.get(index, {}).get(name, self.missing)
+        if value is self.missing:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, index, name, value, version=None):
+        """ Stores a value, unless the cache was invalidated after version """
+        if version is None or version == self.version:
+            self.values.setdefault(index, {})[name] = value
+
+    def invalidate(self, index=None, names=()):
+        """ Invalidates names of the item at index, all attributes of the item
+        if no names are given or the whole cache if no index is given """
+        self.version += 1
+        if index is None:
+            self.values = {}
+        elif not names:
+            self.values.pop(index, None)
+        else:
+            for name in names:
+                self.values.get(index, {}).pop(name, None)
+
+    def stats(self):
+        """ Returns the hit and miss counters """
+        return {'hits': self.hits, 'misses': self.misses}
+
+    def reset_stats(self):
+        """ Resets the hit and miss counters """
+        self.hits = 0
+        self.misses = 0
+
+
+class WorkerAgent(QtCore.QObject): # pylint: disable=too-many-instance-attributes,too-many-public-methods
     """ Enables exchange of data with GUIAgent using signal/slots """
     createSignal = QtCore.Signal(list, dict)
     modifySignal = QtCore.Signal(int, dict)
     requestSignal = QtCore.Signal(int, list)
     methodSignal = QtCore.Signal(int, str, list, dict)
     deleteSignal = QtCore.Signal(int)
+    postModifySignal = QtCore.Signal(int, dict)
+    postMethodSignal = QtCore.Signal(int, str, list, dict)
+    syncSignal = QtCore.Signal()
+    batchSignal = QtCore.Signal(list)
+    asyncCreateSignal = QtCore.Signal(int, list, dict)
+    asyncRequestSignal = QtCore.Signal(int, int, list)
+    asyncMethodSignal = QtCore.Signal(int, int, str, list, dict)
     dataRecevied = QtCore.Signal()
     stopSignalwait = QtCore.Signal()
     no_message = object()
@@ -37,12 +99,22 @@ class WorkerAgent(QtCore.QObject):
     def __init__(self, name, parent=None):
         super().__init__(parent)
         self.error = False
+        self.deferred_error = None
+        self.posted = False
+        self.operations = None
+        self.batch_futures = []
+        self.batch_depth = 0
+        self.call_ids = itertools.count()
+        self.pending_futures = {}
+        self.awaitable = False
+        self.cache = AttributeCache()
         self.message = self.no_message
         self.name = name
-        self.signal_waiter = utils.SignalWaiter(self.dataRecevied,
-                                                error_signal=self.stopSignalwait,
-                                                timeout=params.signal_slot_timeout,
-                                                parent=self)
+        self.signal_waiter = utils.create_waiter(self.dataRecevied,
+                                                 error_signal=self.stopSignalwait,
+                                                 timeout=params.signal_slot_timeout,
+                                                 parent=self)
+        self.stopSignalwait.connect(self.cancel_futures, QtCore.Qt.DirectConnection)
 
     def __repr__(self):
         return f'{self.__class__.__name__}(name={self.name})'
@@ -54,59 +126,223 @@ class WorkerAgent(QtCore.QObject):
         self.requestSignal.connect(gui_agent.request_slot)
         self.methodSignal.connect(gui_agent.method_slot)
         self.deleteSignal.connect(gui_agent.delete_slot)
+        self.postModifySignal.connect(gui_agent.post_modify_slot)
+        self.postMethodSignal.connect(gui_agent.post_method_slot)
+        self.syncSignal.connect(gui_agent.sync_slot)
+        self.batchSignal.connect(gui_agent.batch_slot)
+        self.asyncCreateSignal.connect(gui_agent.async_create_slot)
+        self.asyncRequestSignal.connect(gui_agent.async_request_slot)
+        self.asyncMethodSignal.connect(gui_agent.async_method_slot)
 
     def create(self, *args, **kwargs):
         """ Send out a signal and obtain data from gui_agent"""
+        self.flush_batch()
         with self.signal_waiter:
             self.createSignal.emit(args, kwargs)
         return self.read_message()
 
     def modify(self, index, **kwargs):
         """ Send out a one-way signal with given arguments and keyword arguments """
+        if self.operations is not None:
+            self.record('modify', index, kwargs)
+            return
         with self.signal_waiter:
             self.modifySignal.emit(index, kwargs)
         self.read_message()
 
     def request(self, index, *args):
         """ Obtain data from gui_agent"""
+        if self.operations is not None:
+            return self.record('request', index, args)
         with self.signal_waiter:
             self.requestSignal.emit(index, args)
         return self.read_message()
 
     def method(self, index, func_name, *args, **kwargs):
         """ Send out a signal to execute a method on the gui_agent class """
+        if self.operations is not None:
+            return self.record('method', index, func_name, args, kwargs)
         with self.signal_waiter:
             self.methodSignal.emit(index, func_name, args, kwargs)
         return self.read_message()
 
     def delete(self, index):
         """ Send out a signal to delete object at index on the gui_agent class """
+        if self.operations is not None:
+            self.record('delete', index)
+            return
         with self.signal_waiter:
             self.deleteSignal.emit(index)
         self.read_message()
 
+    def post_modify(self, index, **kwargs):
+        """ Queue a modification on the gui_agent without waiting for it """
+        if self.operations is not None:
+            self.record('modify', index, kwargs)
+            return
+        self.posted = True
+        self.postModifySignal.emit(index, kwargs)
+
+    def post_method(self, index, func_name, *args, **kwargs):
+        """ Queue a method call on the gui_agent without waiting for it """
+        if self.operations is not None:
+            self.record('method', index, func_name, args, kwargs)
+            return
+        self.posted = True
+        self.postMethodSignal.emit(index, func_name, args, kwargs)
+
+    def create_async(self, *args, **kwargs):
+        """ Send out a signal to create an item and return a future of its
+        index """
+        self.flush_batch()
+        call_id, future = self.add_future()
+        self.asyncCreateSignal.emit(call_id, args, kwargs)
+        return future
+
+    def request_async(self, index, *args):
+        """ Request data from gui_agent and return a future of the values """
+        if self.operations is not None:
+            return self.record('request', index, args)
+        call_id, future = self.add_future()
+        self.asyncRequestSignal.emit(call_id, index, args)
+        return future
+
+    def method_async(self, index, func_name, *args, **kwargs):
+        """ Execute a method on the gui_agent class and return a future of its
+        return value """
+        if self.operations is not None:
+            return self.record('method', index, func_name, args, kwargs)
+        call_id, future = self.add_future()
+        self.asyncMethodSignal.emit(call_id, index, func_name, args, kwargs)
+        return future
+
+    def add_future(self):
+        """ Returns a new call id and the future that receives its reply """
+        call_id = next(self.call_ids)
+        future = futures.Future()
+        self.pending_futures[call_id] = future
+        return call_id, future
+
+    @contextmanager
+    def batch(self):
+        """
+        Context manager that records all modify, request, method and delete
+        calls and sends them to the gui_agent in a single signal on exit.
+        Inside the batch, request and method return futures, whose results are
+        available after the batch was sent. Requesting such a result earlier
+        sends the operations recorded so far. Batches can be nested.
+        """
+        if self.operations is None:
+            self.operations = []
+        self.batch_depth += 1
+        try:
+            yield self
+        finally:
+            self.batch_depth -= 1
+            if not self.batch_depth:
+                try:
+                    self.flush_batch()
+                finally:
+                    self.operations = None
+
+    def record(self, *operation):
+        """ Record an operation of the current batch and return its future """
+        self.operations.append(operation)
+        future = futures.Future(resolver=self.flush_batch)
+        self.batch_futures.append(future)
+        return future
+
+    def flush_batch(self):
+        """ Send all operations recorded so far and set the results of their
+        futures """
+        if not self.operations:
+            return
+        operations, self.operations = self.operations, []
+        batch_futures, self.batch_futures = self.batch_futures, []
+        with self.signal_waiter:
+            self.batchSignal.emit(operations)
+        results = self.read_message()
+        if results is self.no_message:
+            for future in batch_futures:
+                future.set_exception(GUIAgentException('Batch failed at GUI side'))
+            return
+        for future, result in zip(batch_futures, results):
+            future.set_result(result)
+
+    def sync(self):
+        """ Wait until the gui_agent has processed all queued operations """
+        self.flush_batch()
+        if not self.posted:
+            return
+        with self.signal_waiter:
+            self.syncSignal.emit()
+        self.read_message()
+
     def read_message(self):
         """ Helper method, that reads message set by slot and returns a copy """
         if self.message is self.no_message:
             if self.error:
+                self.raise_deferred_error()
                 return self.message
             if not self.error:
                 raise WorkerAgentException('No message received')
         message = copy(self.message)
         self.message = self.no_message
+        self.posted = False
+        self.raise_deferred_error()
         return message
 
+    def raise_deferred_error(self):
+        """ Raise the first error of an earlier non-blocking call, if any """
+        if self.deferred_error is None:
+            return
+        _, exc_value, exc_tb = self.deferred_error
+        self.deferred_error = None
+        raise exc_value.with_traceback(exc_tb)
+
     @QtCore.Slot(object)
     def slot(self, data):
         """ Slot for receiving data """
         self.message = data
         self.dataRecevied.emit()
 
+    @QtCore.Slot(int)
+    def invalidate(self, index):
+        """ Slot for invalidating cached attributes of the item at index """
+        self.cache.invalidate(index)
+
     @QtCore.Slot(object)
     def error_detected(self):
         """ If a gui_agent error is detected ... """
         self.error = True
 
+    @QtCore.Slot(int, object)
+    def async_reply(self, call_id, data):
+        """ Slot for receiving the reply of an asynchronous call """
+        if future := self.pending_futures.pop(call_id, None):
+            future.set_result(data)
+
+    @QtCore.Slot(int, tuple)
+    def async_error(self, call_id, error):
+        """ Slot for receiving an error of an asynchronous call """
+        _, exc_value, exc_tb = error
+        if future := self.pending_futures.pop(call_id, None):
+            future.set_exception(exc_value.with_traceback(exc_tb))
+
+    @QtCore.Slot()
+    def cancel_futures(self):
+        """ Fail all futures that are still waiting for a reply """
+        while self.pending_futures:
+            _, future = self.pending_futures.popitem()
+            future.set_exception(WorkerAgentException('No reply received'))
+
+    @QtCore.Slot(tuple)
+    def deferred_error_detected(self, error):
+        """ Register an error of a non-blocking call, which is raised at the
+        next synchronous call """
+        if self.deferred_error is None:
+            self.deferred_error = error
+
     def deleteLater(self): # pylint: disable=invalid-name
         """ Make sure all eventloops in utils.signal_wait are quit before the
         agent is deleted """
@@ -118,6 +354,10 @@ class GUIAgent(QtCore.QObject):
     """ A receiver for operations whose instructions were sent by WorkerAgent """
     signal = QtCore.Signal(object)
     error = QtCore.Signal()
+    deferredError = QtCore.Signal(tuple)
+    asyncReply = QtCore.Signal(int, object)
+    asyncError = QtCore.Signal(int, tuple)
+    itemChanged = QtCore.Signal(int)
 
     def __init__(self, name, container, parent=None):
         super().__init__(parent)
@@ -127,14 +367,21 @@ class GUIAgent(QtCore.QObject):
         self.request = container.request
         self.method = container.method
         self.delete = container.delete
+        container.itemChanged.connect(self.itemChanged)
 
     def __repr__(self):
         return f'{self.__class__.__name__}(name={self.name})'
 
     def connect_agent(self, worker_agent):
         """ Connects the sender to a worker_agent """
-        self.signal.connect(worker_agent.slot)
-        self.error.connect(worker_agent.error_detected)
+        connection = utils.reply_connection()
+        self.signal.connect(worker_agent.slot, connection)
+        self.error.connect(worker_agent.error_detected, connection)
+        self.deferredError.connect(worker_agent.deferred_error_detected,
+                                   QtCore.Qt.DirectConnection)
+        self.asyncReply.connect(worker_agent.async_reply, QtCore.Qt.DirectConnection)
+        self.asyncError.connect(worker_agent.async_error, QtCore.Qt.DirectConnection)
+        self.itemChanged.connect(worker_agent.invalidate, QtCore.Qt.DirectConnection)
 
     @contextmanager
     def register_exception(self):
@@ -145,6 +392,22 @@ class GUIAgent(QtCore.QObject):
             self.error.emit()
             raise
 
+    @contextmanager
+    def defer_exception(self):
+        """ Shorthand to hand errors of non-blocking calls to the worker side """
+        try:
+            yield
+        except Exception as err: # pylint: disable=broad-except
+            self.deferredError.emit((type(err), err, err.__traceback__))
+
+    @contextmanager
+    def reply_async(self, call_id):
+        """ Shorthand to hand errors of asynchronous calls to their future """
+        try:
+            yield
+        except Exception as err: # pylint: disable=broad-except
+            self.asyncError.emit(call_id, (type(err), err, err.__traceback__))
+
     @QtCore.Slot(list, dict)
     def create_slot(self, args, kwargs):
         """ Slot for creating a new class instance """
@@ -177,3 +440,47 @@ class GUIAgent(QtCore.QObject):
         with self.register_exception():
             self.delete(index)
             self.signal.emit(True)
+
+    @QtCore.Slot(int, dict)
+    def post_modify_slot(self, index, kwargs):
+        """ Slot for modifying an instance attribute without reply """
+        with self.defer_exception():
+            self.modify(index, kwargs)
+
+    @QtCore.Slot(int, str, list, dict)
+    def post_method_slot(self, index, func, args, kwargs):
+        """ Slot for calling a class instance method without reply """
+        with self.defer_exception():
+            self.method(index, func, args, kwargs)
+
+    @QtCore.Slot()
+    def sync_slot(self):
+        """ Slot for confirming that all earlier operations were processed """
+        with self.register_exception():
+            self.signal.emit(True)
+
+    @QtCore.Slot(list)
+    def batch_slot(self, operations):
+        """ Slot for carrying out a list of operations in order """
+        with self.register_exception():
+            results = [getattr(self, operation)(*arguments)
+                       for operation, *arguments in operations]
+            self.signal.emit(results)
+
+    @QtCore.Slot(int, list, dict)
+    def async_create_slot(self, call_id, args, kwargs):
+        """ Slot for creating a new class instance asynchronously """
+        with self.reply_async(call_id):
+            self.asyncReply.emit(call_id, self.create(args, kwargs))
+
+    @QtCore.Slot(int, int, list)
+    def async_request_slot(self, call_id, index, args):
+        """ Slot for requesting an instance attribute asynchronously """
+        with self.reply_async(call_id):
+            self.asyncReply.emit(call_id, self.request(index, args))
+
+    @QtCore.Slot(int, int, str, list, dict)
+    def async_method_slot(self, call_id, index, func, args, kwargs):
+        """ Slot for calling a class instance method asynchronously """
+        with self.reply_async(call_id):
+            self.asyncReply.emit(call_id, self.method(index, func, args, kwargs))
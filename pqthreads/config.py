@@ -16,6 +16,8 @@ class Parameters:
     """Configuration parameters for pqthreads"""
 
     signal_slot_timeout: int = 1_000
+    blocking_calls: bool = True
+    waiter: str = 'eventloop'
     application_attributes: list[Attribute] = field(default_factory=list)
 
     def set_application_attribute(
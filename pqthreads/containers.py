@@ -3,6 +3,7 @@
 import weakref
 from pqthreads.qt import QtCore
 from pqthreads import descriptors
+from pqthreads import futures
 
 
 class RootException(Exception):
@@ -16,12 +17,16 @@ class ItemException(RootException):
 class GUIItemContainer(QtCore.QObject):
     """
     Controller for a container with instances of user-supplied GUI element class
+
+    The signal itemChanged is emitted whenever an item is modified, one of its
+    methods is called or it's deleted.
     """
+    itemChanged = QtCore.Signal(int)
 
     def __init__(self, item_class, parent=None):
         super().__init__(parent)
-        self.items = []
-        self.indices = []
+        self.items = {}
+        self.next_index = 0
         self.item_class = item_class
 
     def __repr__(self):
@@ -30,27 +35,29 @@ class GUIItemContainer(QtCore.QObject):
     @property
     def count(self):
         """ Current number of items """
-        if not self.indices:
-            return 0
-        return max(self.indices) + 1
+        return len(self.items)
 
     def back(self):
         """ Returns the last item """
-        return self.items[-1]
+        return self.items[next(reversed(self.items))]
 
     def get_item(self, index):
         """ Returns the item at index """
         try:
             return self.items[index]
-        except IndexError as err:
+        except KeyError as err:
+            if 0 <= index < self.next_index:
+                raise ItemException(f'Stale index {index}, {self.item_class.__name__} '
+                                    'item was deleted') from err
             raise ItemException(f'Index not find for {self.item_class} items') from err
 
     def create(self, args, kwargs):
-        """ Creates a new item instance with user-supplied item class """
-        index = self.count
-        new_item = self.item_class(index, *args, **kwargs)
-        self.items.append(new_item)
-        self.indices.append(index)
+        """ Creates a new item instance with user-supplied item class. Indices
+        are allocated monotonically and never reused, so stale indices of
+        deleted items are detected. """
+        index = self.next_index
+        self.next_index += 1
+        self.items[index] = self.item_class(index, *args, **kwargs)
         return index
 
     def request(self, index, args):
@@ -61,25 +68,31 @@ class GUIItemContainer(QtCore.QObject):
     def modify(self, index, kwargs):
         """ Modifies item's attributes"""
         item = self.get_item(index)
-        for key, value in kwargs.items():
-            setattr(item, key, value)
+        try:
+            for key, value in kwargs.items():
+                setattr(item, key, value)
+        finally:
+            self.itemChanged.emit(index)
 
     def method(self, index, func_name, args, kwargs):
         """ Execute method on item """
         item = self.get_item(index)
         func = getattr(item, func_name)
-        return func(*args, **kwargs)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self.itemChanged.emit(index)
 
     def delete(self, index):
         """ Deletes the item at index """
-        remove_index = self.indices.index(index)
-        del self.indices[remove_index]
-        item = self.items.pop(remove_index)
+        item = self.get_item(index)
+        del self.items[index]
         item.delete()
+        self.itemChanged.emit(index)
 
     def __del__(self):
         """ Make sure all items are deleted """
-        for item in self.items:
+        for item in self.items.values():
             if item:
                 try:
                     item.deleteLater()
@@ -99,10 +112,11 @@ class WorkerItem:
 
     @classmethod
     def with_agent(cls, agent):
-        """ Set the agent """
-        cls.agent = agent
-        cls.factory.set_agent(agent)
-        return cls
+        """ Returns a subclass that uses agent, such that several worker
+        threads can use the same item class with their own agents """
+        namespace = {'agent': agent, '__module__': cls.__module__,
+                     '__qualname__': cls.__qualname__}
+        return type(cls.__name__, (cls,), namespace)
 
     def __init__(self, *args, **kwargs):
         self.index = self.agent.create(*args, **kwargs)
@@ -110,27 +124,99 @@ class WorkerItem:
     def __repr__(self):
         return f'{self.__class__.__name__}(index={self.index})'
 
+    @classmethod
+    def attribute_descriptors(cls):
+        """ Returns a dict with all attribute descriptors, keyed by name """
+        attributes = {}
+        for klass in reversed(cls.__mro__):
+            for name, value in vars(klass).items():
+                if isinstance(value, descriptors.AttributeDescriptor):
+                    attributes[name] = value
+        return attributes
+
+    def check_attributes(self, names):
+        """ Returns the descriptors of names, raises AttributeError for names
+        that aren't declared attributes """
+        attributes = self.attribute_descriptors()
+        try:
+            return [attributes[name] for name in names]
+        except KeyError as err:
+            raise AttributeError(f'{self.__class__.__name__} has no attribute {err}') from err
+
+    def get_many(self, *names):
+        """ Returns a list with the values of attributes names, using a single
+        request. Returns a future inside a batch or if the agent is awaitable """
+        self.check_attributes(names)
+        if self.agent.awaitable:
+            return self.agent.request_async(self.index, *names)
+        return self.agent.request(self.index, *names)
+
+    def snapshot(self):
+        """ Returns a dict with the values of all declared attributes, using a
+        single request. Returns a future inside a batch or if the agent is
+        awaitable """
+        names = list(self.attribute_descriptors())
+        values = self.get_many(*names)
+        if isinstance(values, futures.Future):
+            return values.then(lambda values: dict(zip(names, values)))
+        return dict(zip(names, values))
+
+    def set_many(self, **kwargs):
+        """ Sets the attributes in kwargs, using a single modification. It's
+        queued if none of the attributes is blocking or if the agent is
+        awaitable """
+        attributes = self.check_attributes(kwargs)
+        if self.agent.awaitable or not any(attr.is_blocking for attr in attributes):
+            self.agent.post_modify(self.index, **kwargs)
+        else:
+            self.agent.modify(self.index, **kwargs)
+        for attribute in attributes:
+            if attribute.cached:
+                self.agent.cache.set(self.index, attribute.name, kwargs[attribute.name])
+
+    def invalidate(self, *names):
+        """ Invalidates cached values of attributes names, or of all
+        attributes if no names are given """
+        self.agent.cache.invalidate(self.index, names)
+
+    def get_async(self, name):
+        """ Returns a future of the value of attribute name """
+        return getattr(type(self), name).get_async(self)
+
     def close(self):
         """ Closes the current figure on the GUI side """
         self.agent.delete(self.index)
 
 
 class WorkerItemContainer:
-    """ Abstract Worker Item Container class """
+    """ Abstract Worker Item Container class, with items keyed by their index
+    in creation order """
 
     def __init__(self, item_class):
         self.item_class = item_class
-        self.items = []
+        self.items = {}
         self.current = None
 
     def __repr__(self):
-        repr_string = '['
-        for idx, figure in enumerate(self.items):
-            if idx > 0:
-                repr_string += ', '
-            repr_string += repr(figure)
-        repr_string += ']'
-        return repr_string
+        return '[' + ', '.join(repr(item) for item in self.items.values()) + ']'
+
+    @property
+    def count(self):
+        """ Current number of items """
+        return len(self.items)
+
+    def __iter__(self):
+        """ Iterate over weak reference proxies of the items in creation order """
+        return (weakref.proxy(item) for item in list(self.items.values()))
+
+    def cache_stats(self):
+        """ Returns the hit and miss counters of the attribute cache """
+        return self.item_class.agent.cache.stats()
+
+    def batch(self):
+        """ Context manager that sends all calls of the items in this container
+        in a single signal, see WorkerAgent.batch """
+        return self.item_class.agent.batch()
 
     def create(self, *args, **kwargs):
         """ Create a new FigureWorker and return a weak reference proxy """
@@ -140,11 +226,18 @@ class WorkerItemContainer:
 
     def append(self, item):
         """ Append an item """
-        self.items.append(item)
+        self.items[item.index] = item
 
     def back(self):
         """ Returns the last item """
-        return self.items[-1]
+        return self.items[next(reversed(self.items))]
+
+    def get(self, index):
+        """ Returns a weak reference proxy of the item with GUI index """
+        try:
+            return weakref.proxy(self.items[index])
+        except KeyError as err:
+            raise ItemException(f'No {self.item_class.__name__} with index {index}') from err
 
     def close(self, item):
         """
@@ -152,6 +245,15 @@ class WorkerItemContainer:
         After calling this function, weak references to this item will no longer
         be valid.
         """
-        index = self.items.index(item)
-        worker_item = self.items.pop(index)
+        worker_item = self.items.pop(item.index)
         worker_item.close()
+
+    def close_many(self, items):
+        """ Close multiple items, using a single batch of delete operations """
+        with self.batch():
+            for item in list(items):
+                self.close(item)
+
+    def close_all(self):
+        """ Close all items, using a single batch of delete operations """
+        self.close_many(self.items.values())
@@ -5,6 +5,8 @@ worker thread and the GUI thread.
 """
 
 import sys
+import asyncio
+import inspect
 from pqthreads.qt import QtCore, QtWidgets
 from pqthreads import agents
 from pqthreads import utils
@@ -42,6 +44,16 @@ class WorkerAgency(QtCore.QObject):
         self.worker_containers[name] = container
         refs.worker.add(name, container)
 
+    def set_awaitable(self, awaitable):
+        """ Let descriptors of all worker agents return awaitable futures """
+        for agent in self.worker_agents.values():
+            agent.awaitable = awaitable
+
+    def sync(self):
+        """ Wait for all queued operations of the worker agents to finish """
+        for agent in self.worker_agents.values():
+            agent.sync()
+
     def stop_signal_wait(self):
         """ Stop signal wait """
         for agent in self.worker_agents.values():
@@ -63,42 +75,98 @@ class FunctionWorker(QtCore.QObject):
     @QtCore.Slot()
     def run(self):
         """ Run the function with exception handling """
+        refs.worker.bind(self.agency.worker_containers)
         try:
-            self.result = self.function(*self.args, **self.kwargs)
+            self.result = self.call_function()
+            self.agency.sync()
         except BaseException as err: # pylint: disable=broad-except
             raised_exception = (type(err), err, err.__traceback__)
             self.agency.workerErrorSignal.emit(raised_exception)
         finally:
+            refs.worker.unbind()
             self.finished.emit()
 
+    def call_function(self):
+        """ Call the function, coroutine functions are run in an asyncio event
+        loop, with awaitable descriptors """
+        if not inspect.iscoroutinefunction(self.function):
+            return self.function(*self.args, **self.kwargs)
+        self.agency.set_awaitable(True)
+        try:
+            return asyncio.run(self.function(*self.args, **self.kwargs))
+        finally:
+            self.agency.set_awaitable(False)
+
     def get_result(self):
         """ Return the result """
         return self.result
 
 
-class GUIAgency(QtCore.QObject): # pylint: disable=too-many-instance-attributes
-    """ Controller class which coordinates all figure and axis objects """
+class WorkerThread(QtCore.QObject):
+    """ A worker thread with its function worker, worker agency and the GUI
+    agents that serve its worker agents """
+    stopped = QtCore.Signal()
+
+    def __init__(self, function, gui_containers, *args, **kwargs):
+        super().__init__()
+        self.thread = QtCore.QThread(parent=self)
+        self.worker_agency = WorkerAgency()
+        self.worker = FunctionWorker(function, self.worker_agency, *args, **kwargs)
+        self.gui_agents = {}
+        self.result = None
+        for name, container in gui_containers.items():
+            self.gui_agents[name] = agents.GUIAgent(name, container, parent=self)
+            self.worker_agency.add_agent(name)
+
+    def setup(self):
+        """ Move the worker to its thread and connect all agents """
+        self.worker.moveToThread(self.thread)
+        self.worker_agency.moveToThread(self.thread)
+        for name, agent in self.gui_agents.items():
+            self.worker_agency.agent(name).connect_agent(agent)
+            agent.connect_agent(self.worker_agency.agent(name))
+        self.thread.started.connect(self.worker.run)
+        self.worker.finished.connect(self.stop)
+
+    def start(self):
+        """ Start the worker thread """
+        self.thread.start()
+
+    def is_running(self):
+        """ Whether the worker thread is still running """
+        try:
+            return self.thread.isRunning()
+        except RuntimeError:
+            return False
+
+    @QtCore.Slot()
+    def stop(self):
+        """ Stop the worker thread """
+        self.result = self.worker.get_result()
+        self.thread.quit()
+        self.thread.wait()
+        self.stopped.emit()
+
+
+class GUIAgency(QtCore.QObject):
+    """ Controller class which coordinates all figure and axis objects. It
+    serves one or more worker threads, that share the same GUI containers """
     gui_agents_classes = {}
-    worker_agents = []
 
     @classmethod
     def add_agent(cls, name, item_class):
         """ Add GUI agent """
         cls.gui_agents_classes[name] = item_class
-        cls.worker_agents.append(name)
 
-    def __init__(self, worker, *args, **kwargs):
+    def __init__(self, worker=None, *args, **kwargs): # pylint: disable=keyword-arg-before-vararg
         super().__init__(kwargs.pop('parent', None))
         self.application = self.get_application()
-        self.gui_agents = {}
         self.gui_containers = {}
-        self.result = None
+        self.worker_threads = []
         self.raised_exception = None
-        self.thread = QtCore.QThread(parent=self)
-        self.worker_agency = WorkerAgency()
-        self.worker = FunctionWorker(worker, self.worker_agency, *args, **kwargs)
-        self.setup_agents()
-        self.setup_worker()
+        self.setup_containers()
+        if worker is not None:
+            self.add_worker(worker, *args, **kwargs)
 
     @staticmethod
     def get_application():
@@ -109,38 +177,56 @@ class GUIAgency(QtCore.QObject): # pylint: disable=too-many-instance-attributes
             return QtWidgets.QApplication(sys.argv)
         return QtWidgets.QApplication.instance()
 
-    def setup_agents(self):
-        """ Setup GUI agents """
+    def setup_containers(self):
+        """ Setup GUI containers """
         for name, item_class in self.gui_agents_classes.items():
             self.gui_containers[name] = containers.GUIItemContainer(item_class, parent=self)
-            self.gui_agents[name] = agents.GUIAgent(name, self.gui_containers[name], parent=self)
             refs.gui.add(name, self.gui_containers[name])
 
-    def setup_worker(self):
-        """ Setup worker thread """
-        # add worker agents
-        for worker_agent in self.worker_agents:
-            self.worker_agency.add_agent(worker_agent)
-        self.worker.moveToThread(self.thread)
-        self.worker_agency.moveToThread(self.thread)
-        # connect agents
-        for name, agent in self.gui_agents.items():
-            self.worker_agency.agent(name).connect_agent(agent)
-            agent.connect_agent(self.worker_agency.agent(name))
-        self.worker_agency.workerErrorSignal.connect(self.worker_exception_raised)
-        # connect other signals/slots
-        self.thread.started.connect(self.worker.run)
-        self.worker.finished.connect(self.stop_thread)
+    def add_worker(self, function, *args, **kwargs):
+        """ Add a worker thread that runs function and returns its worker
+        agency """
+        worker_thread = WorkerThread(function, self.gui_containers, *args, **kwargs)
+        worker_thread.setParent(self)
+        worker_thread.setup()
+        worker_thread.worker_agency.workerErrorSignal.connect(self.worker_exception_raised)
+        worker_thread.stopped.connect(self.exit_windowless_application)
+        self.worker_threads.append(worker_thread)
+        return worker_thread.worker_agency
+
+    @property
+    def worker_agencies(self):
+        """ Worker agencies of all worker threads """
+        return [worker_thread.worker_agency for worker_thread in self.worker_threads]
+
+    @property
+    def worker_agency(self):
+        """ Worker agency of the first worker thread """
+        return self.worker_threads[0].worker_agency
+
+    @property
+    def results(self):
+        """ Results of all worker threads """
+        return [worker_thread.result for worker_thread in self.worker_threads]
+
+    @property
+    def result(self):
+        """ Result of the first worker thread """
+        if not self.worker_threads:
+            return None
+        return self.worker_threads[0].result
 
     def excepthook(self, exc_type, exc_value, exc_tb):
         """ Catch any exception and print it """
         self.raised_exception = (exc_type, exc_value, exc_tb)
         sys.__excepthook__(exc_type, exc_value, exc_tb)
-        self.worker_agency.stop_signal_wait()
+        for worker_agency in self.worker_agencies:
+            worker_agency.stop_signal_wait()
 
     def execute(self):
-        """ Create QApplication, start worker thread and the main event loop """
-        self.thread.start()
+        """ Create QApplication, start worker threads and the main event loop """
+        for worker_thread in self.worker_threads:
+            worker_thread.start()
         try:
             sys.excepthook = self.excepthook
             utils.compat_exec(self.application)
@@ -151,34 +237,24 @@ class GUIAgency(QtCore.QObject): # pylint: disable=too-many-instance-attributes
                 raise exc_type(exc_value).with_traceback(exc_tb)
             self.application.exit()
 
-    @QtCore.Slot()
-    def stop_thread(self):
-        """ Stop the worker thread """
-        self.result = self.worker.get_result()
-        self.thread.quit()
-        self.thread.wait()
-        self.exit_windowless_application()
-
     @QtCore.Slot()
     def exit_windowless_application(self):
-        """ Exit the application if now windows are open """
+        """ Exit the application if all workers stopped and no windows are open """
+        if any(worker_thread.is_running() for worker_thread in self.worker_threads):
+            return
         if not self.application.topLevelWidgets():
             self.application.exit()
 
     def wait_for_thread(self):
-        """ Wait for the worker thread to finish """
-        while True:
-            try:
-                if not self.thread.isRunning():
-                    break
-            except RuntimeError:
-                break
+        """ Wait for all worker threads to finish """
+        while any(worker_thread.is_running() for worker_thread in self.worker_threads):
             self.application.processEvents()
 
     @QtCore.Slot()
     def worker_exception_raised(self, worker_exception):
         """ Make sure the GUI threads stops, by closing all open windows and
-        register the caught exception """
+        register the first caught exception """
         self.application.closeAllWindows()
-        self.raised_exception = worker_exception
+        if self.raised_exception is None:
+            self.raised_exception = worker_exception
         sys.__excepthook__(*worker_exception)
@@ -31,13 +31,35 @@ class DecoratorCore:
 
     def wrapper(self, wrapped, args, kwargs):
         """ Simplified short hand for caller function """
-        gui_agency = self.gui_agency_class(worker=wrapped, *args, **kwargs)
-        self.add_worker_agents(gui_agency.worker_agency)
-        gui_agency.execute()
-        refs.gui.clear()
-        refs.worker.clear()
+        gui_agency = self.gui_agency_class(wrapped, *args, **kwargs)
+        self.execute(gui_agency)
         return gui_agency.result
 
+    def run_workers(self, workers):
+        """
+        Run several worker functions concurrently, each in its own worker
+        thread, and return a list with their results. All workers share the
+        same GUI items. Each worker is either a function or a tuple (function,
+        args, kwargs), decorated functions are unwrapped.
+        """
+        gui_agency = self.gui_agency_class()
+        for worker in workers:
+            function, args, kwargs = worker if isinstance(worker, tuple) else (worker, (), {})
+            function = getattr(function, '__wrapped__', function)
+            gui_agency.add_worker(function, *args, **kwargs)
+        self.execute(gui_agency)
+        return gui_agency.results
+
+    def execute(self, gui_agency):
+        """ Add the worker agents, execute the gui_agency and clean up """
+        for worker_agency in gui_agency.worker_agencies:
+            self.add_worker_agents(worker_agency)
+        try:
+            gui_agency.execute()
+        finally:
+            refs.gui.clear()
+            refs.worker.clear()
+
     def add_gui_agents(self, gui_agency_class):
         """ Add GUI agents """
         for name, gui_class in self.gui_agents.items():
@@ -60,3 +82,8 @@ class Decorator: # pylint: disable=too-few-public-methods
         if wrapped is None:
             return functools.partial(self.__call__, **kwargs)
         return self.decorator_class(**kwargs)(wrapped)
+
+    def concurrent(self, *workers, **kwargs):
+        """ Run worker functions concurrently and return their results, see
+        DecoratorCore.run_workers """
+        return self.decorator_class(**kwargs).run_workers(workers)
@@ -3,6 +3,10 @@ Descriptors for attributes and methods for work thread classes in mlpyqtgraph
 
 """
 
+import operator
+from pqthreads import futures
+from pqthreads.config import params
+
 
 class AbstractDescriptor:
     """
@@ -16,8 +20,9 @@ class AbstractDescriptor:
         cls.agent = agent
         return cls
 
-    def __init__(self):
+    def __init__(self, blocking=None):
         self.name = None
+        self.blocking = blocking
 
     def __set_name__(self, owner, name):
         self.name = name
@@ -28,6 +33,14 @@ class AbstractDescriptor:
     def __repr__(self):
         return f'Descriptor(agent={repr(self.agent)}'
 
+    @property
+    def is_blocking(self):
+        """ Whether calls wait for the GUI side, falls back to the global
+        configuration if not set for this descriptor """
+        if self.blocking is None:
+            return params.blocking_calls
+        return self.blocking
+
 
 class AttributeDescriptor(AbstractDescriptor):
     """
@@ -36,14 +49,56 @@ class AttributeDescriptor(AbstractDescriptor):
 
     This descriptor enables setting and getting object instance attributes using
     a agent. It expects the presence of a agent object and index on
-    its parent object instance.
+    its parent object instance, see WorkerItem.with_agent.
+
+    If the descriptor is non-blocking, setting the attribute is queued and
+    returns immediately. Getting the attribute waits for the value, except
+    inside a batch, where a future is returned.
+
+    If the agent is awaitable (i.e. the worker function is a coroutine
+    function), getting returns an awaitable future and setting is queued.
+
+    A cached descriptor stores values in the attribute cache of the agent.
+    Setting the attribute writes through to the cache, which assumes that the
+    GUI side stores the value as is. Cached values are invalidated if the GUI
+    item is modified, one of its methods is called or if invalidated
+    explicitly with WorkerItem.invalidate.
     """
+    def __init__(self, blocking=None, cached=False):
+        super().__init__(blocking=blocking)
+        self.cached = cached
+
     def __get__(self, obj, owner=None):
-        return self.agent.request(obj.index, self.name)[0]
+        if obj is None:
+            return self
+        agent = obj.agent
+        if self.cached:
+            value = agent.cache.get(obj.index, self.name)
+            if value is not agent.cache.missing:
+                return futures.completed(value) if agent.awaitable else value
+        if agent.awaitable:
+            return self.get_async(obj)
+        version = agent.cache.version
+        values = agent.request(obj.index, self.name)
+        if isinstance(values, futures.Future):
+            return values.then(operator.itemgetter(0))
+        if self.cached:
+            agent.cache.set(obj.index, self.name, values[0], version)
+        return values[0]
 
     def __set__(self, obj, value):
         kwargs = {self.name: value}
-        self.agent.modify(obj.index, **kwargs)
+        if self.is_blocking and not obj.agent.awaitable:
+            obj.agent.modify(obj.index, **kwargs)
+        else:
+            obj.agent.post_modify(obj.index, **kwargs)
+        if self.cached:
+            obj.agent.cache.set(obj.index, self.name, value)
+
+    def get_async(self, obj):
+        """ Returns a future of the attribute value of obj """
+        values = obj.agent.request_async(obj.index, self.name)
+        return values.then(operator.itemgetter(0))
 
     def __repr__(self):
         return 'Attribute' + super().__repr__()
@@ -55,24 +110,54 @@ class MethodDescriptor(AbstractDescriptor):
 
     This descriptor enables calling method of an object instance using a custom
     agent. It expects the presence of a agent object and index on its
-    parent object instance.
-    """
-    def __init__(self):
-        super().__init__()
-        self.index = None
+    parent object instance, see WorkerItem.with_agent. Getting the descriptor
+    from an instance returns a BoundMethod.
 
+    If the descriptor is non-blocking, the method call is queued and returns
+    None immediately. If the agent is awaitable (i.e. the worker function is a
+    coroutine function), the call returns an awaitable future.
+    """
     def __get__(self, obj, owner=None):
-        try:
-            self.index = obj.index
-        except AttributeError:
-            pass
-        return self
+        if obj is None:
+            return self
+        return BoundMethod(self, obj)
+
+    def call(self, obj, *args, **kwargs):
+        """ Call the method of obj """
+        agent = obj.agent
+        if agent.awaitable:
+            return agent.method_async(obj.index, self.name, *args, **kwargs)
+        if self.is_blocking:
+            return agent.method(obj.index, self.name, *args, **kwargs)
+        agent.post_method(obj.index, self.name, *args, **kwargs)
+        return None
+
+    def submit(self, obj, *args, **kwargs):
+        """ Call the method of obj without waiting and return a future of its
+        return value """
+        return obj.agent.method_async(obj.index, self.name, *args, **kwargs)
+
+    def __repr__(self):
+        return 'Method' + super().__repr__()
+
+
+class BoundMethod:
+    """ Method descriptor bound to a worker item """
+
+    def __init__(self, descriptor, obj):
+        self.descriptor = descriptor
+        self.obj = obj
 
     def __call__(self, *args, **kwargs):
-        return self.agent.method(self.index, self.name, *args, **kwargs)
+        return self.descriptor.call(self.obj, *args, **kwargs)
+
+    def submit(self, *args, **kwargs):
+        """ Call the method without waiting and return a future of its return
+        value """
+        return self.descriptor.submit(self.obj, *args, **kwargs)
 
     def __repr__(self):
-        return 'Method' + super().__repr__()
+        return f'{self.__class__.__name__}(name={self.descriptor.name}, obj={self.obj!r})'
 
 
 
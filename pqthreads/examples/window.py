@@ -14,6 +14,7 @@ class FigureWindow(QtWidgets.QMainWindow):
     def __init__(self, index, **kwargs):
         super().__init__(parent=kwargs.pop('parent', None))
         self.index = index
+        self.tag = kwargs.get('tag')
         self.resize(kwargs.get('width', 600), kwargs.get('height', 500))
         self.change_title(title=kwargs.get('title', 'Untitled'))
         self.show()
@@ -34,6 +35,16 @@ class FigureWindow(QtWidgets.QMainWindow):
         """ Sets the window title """
         self.change_title(title)
 
+    @property
+    def opacity(self):
+        """ Returns the window opacity """
+        return self.windowOpacity()
+
+    @opacity.setter
+    def opacity(self, opacity):
+        """ Sets the window opacity """
+        self.setWindowOpacity(opacity)
+
     def raise_window(self):
         """ Raises the current window to top """
         if sys.platform == 'win32':
@@ -17,6 +17,8 @@ class FigureWorker(containers.WorkerItem):
     raise_window = factory.method()
     change_title = factory.method()
     title = factory.attribute()
+    opacity = factory.attribute()
+    tag = factory.attribute(cached=True)
     raise_exception = factory.method()
 
     def raise_worker_exception(self):
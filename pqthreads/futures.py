@@ -0,0 +1,121 @@
+""" Future module for results that become available at a later point in time """
+
+import asyncio
+import threading
+
+
+class FutureException(Exception):
+    """ This Exception is raised if the result of a future isn't available in
+    time """
+
+
+class Future:
+    """
+    Placeholder for the result of an operation that is carried out later on,
+    possibly in another thread.
+
+    An optional resolver is called when the result is requested before it's
+    available, e.g. to send out recorded operations that produce the result.
+    """
+
+    def __init__(self, resolver=None):
+        self.resolver = resolver
+        self.value = None
+        self.error = None
+        self.callbacks = []
+        self.event = threading.Event()
+        self.lock = threading.Lock()
+
+    def __repr__(self):
+        state = 'done' if self.done() else 'pending'
+        return f'{self.__class__.__name__}(state={state})'
+
+    def done(self):
+        """ Returns whether the result or an exception was set """
+        return self.event.is_set()
+
+    def set_result(self, value):
+        """ Set the result and notify waiters and callbacks """
+        self.value = value
+        self.finish()
+
+    def set_exception(self, error):
+        """ Set an exception, which is raised when the result is requested """
+        self.error = error
+        self.finish()
+
+    def finish(self):
+        """ Mark the future as done and run the registered callbacks """
+        with self.lock:
+            self.event.set()
+            callbacks, self.callbacks = self.callbacks, []
+        for callback in callbacks:
+            callback(self)
+
+    def add_done_callback(self, callback):
+        """ Call callback with this future as argument, once it's done """
+        with self.lock:
+            if not self.event.is_set():
+                self.callbacks.append(callback)
+                return
+        callback(self)
+
+    def result(self, timeout=None):
+        """ Returns the result, waits at most timeout seconds if not done """
+        if not self.done() and self.resolver is not None:
+            self.resolver()
+        if not self.event.wait(timeout):
+            raise FutureException('Result not available in time')
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+    def __await__(self):
+        """ Enables awaiting the result in an asyncio event loop """
+        if not self.done() and self.resolver is not None:
+            self.resolver()
+        loop = asyncio.get_running_loop()
+        awaitable = loop.create_future()
+
+        def transfer(future):
+            loop.call_soon_threadsafe(copy_state, future, awaitable)
+
+        self.add_done_callback(transfer)
+        return awaitable.__await__()
+
+    def then(self, func):
+        """ Returns a new future with the result of func applied to the result
+        of this future """
+        future = Future(resolver=self.result)
+
+        def transfer(parent):
+            if parent.error is not None:
+                future.set_exception(parent.error)
+            else:
+                future.set_result(func(parent.value))
+
+        self.add_done_callback(transfer)
+        return future
+
+
+def copy_state(future, awaitable):
+    """ Copy the result or exception of future to an asyncio future """
+    if awaitable.cancelled():
+        return
+    if future.error is not None:
+        awaitable.set_exception(future.error)
+    else:
+        awaitable.set_result(future.value)
+
+
+def completed(value):
+    """ Returns a future whose result is already set to value """
+    future = Future()
+    future.set_result(value)
+    return future
+
+
+def gather(*futures, timeout=None):
+    """ Returns the results of all futures in order. The timeout (s) applies
+    to each future separately. """
+    return [future.result(timeout) for future in futures]
@@ -1,5 +1,6 @@
 """ Reference module """
 
+import threading
 import weakref
 
 
@@ -18,8 +19,13 @@ class WeakReferences:
 
     def get(self, name):
         """ Returns the weak reference """
+        return self.lookup(self.references, name)
+
+    @staticmethod
+    def lookup(references, name):
+        """ Returns the weak reference from references """
         try:
-            ref = self.references[name]
+            ref = references[name]
         except KeyError as exc:
             raise KeyError(f'No weak reference found for {name}') from exc
         if not ref:
@@ -31,5 +37,29 @@ class WeakReferences:
         self.references = {}
 
 
-worker = WeakReferences()
+class ThreadWeakReferences(WeakReferences):
+    """ Class for holding weak references, which can be bound to the current
+    thread. Threads with bound references use these instead of the shared
+    references """
+    def __init__(self):
+        super().__init__()
+        self.local = threading.local()
+
+    def bind(self, references):
+        """ Binds weak references to the current thread """
+        self.local.references = {name: weakref.proxy(reference)
+                                 for name, reference in references.items()}
+
+    def unbind(self):
+        """ Removes the weak references bound to the current thread """
+        self.local.references = None
+
+    def get(self, name):
+        """ Returns the weak reference, preferably bound to the current thread """
+        if references := getattr(self.local, 'references', None):
+            return self.lookup(references, name)
+        return super().get(name)
+
+
+worker = ThreadWeakReferences()
 gui = WeakReferences()
@@ -2,6 +2,7 @@
 
 from pqthreads.qt import PySide
 from pqthreads.qt import QtCore
+from pqthreads.config import params
 
 
 def compat_exec(obj):
@@ -14,21 +15,83 @@ def compat_exec(obj):
 
 class SignalWaiter(QtCore.QObject):
     """ Context manager that blocks loop until signal emitted, or timeout (ms)
-    elapses. """
+    elapses. The event loop and timer are created on first use in the waiting
+    thread and reused afterwards. """
     def __init__(self, signal, error_signal=None, timeout=1000, parent=None):
         super().__init__(parent=parent)
         self.signal = signal
         self.error_signal = error_signal
         self.timeout = timeout
         self.loop = None
+        self.timer = None
 
-    def __enter__(self):
+    def setup(self):
+        """ Create the event loop and timeout timer """
         self.loop = QtCore.QEventLoop(parent=self)
         self.signal.connect(self.loop.quit)
         if self.error_signal is not None:
             self.error_signal.connect(self.loop.quit)
+        if self.timeout is not None:
+            self.timer = QtCore.QTimer(parent=self)
+            self.timer.setSingleShot(True)
+            self.timer.setInterval(self.timeout)
+            self.timer.timeout.connect(self.loop.quit)
+
+    def __enter__(self):
+        if self.loop is None:
+            self.setup()
 
     def __exit__(self, exc_type, exc_value, exc_tb):
-        if self.timeout is not None:
-            QtCore.QTimer.singleShot(self.timeout, self.loop.quit)
+        if self.timer is not None:
+            self.timer.start()
         compat_exec(self.loop)
+        if self.timer is not None:
+            self.timer.stop()
+
+
+class SemaphoreWaiter(QtCore.QObject):
+    """ Context manager that blocks the current thread on a semaphore until
+    signal emitted, or timeout (ms) elapses. The signals are connected
+    directly, so they must be emitted from another thread than the waiting
+    one. No events are processed in the waiting thread while it waits. """
+    def __init__(self, signal, error_signal=None, timeout=1000, parent=None):
+        super().__init__(parent=parent)
+        self.ready = QtCore.QSemaphore()
+        self.timeout = -1 if timeout is None else timeout
+        signal.connect(self.wake, QtCore.Qt.DirectConnection)
+        if error_signal is not None:
+            error_signal.connect(self.wake, QtCore.Qt.DirectConnection)
+
+    @QtCore.Slot()
+    def wake(self):
+        """ Wake up the waiting thread """
+        self.ready.release()
+
+    def __enter__(self):
+        self.ready.tryAcquire(self.ready.available())
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self.ready.tryAcquire(1, self.timeout)
+
+
+waiters = {
+    'eventloop': SignalWaiter,
+    'semaphore': SemaphoreWaiter,
+}
+
+
+def create_waiter(signal, error_signal=None, timeout=1000, parent=None):
+    """ Create a waiter of the type configured in params.waiter """
+    try:
+        waiter_class = waiters[params.waiter]
+    except KeyError as err:
+        raise ValueError(f'Unknown waiter type: {params.waiter}') from err
+    return waiter_class(signal, error_signal=error_signal, timeout=timeout, parent=parent)
+
+
+def reply_connection():
+    """ Connection type for replies to a waiting thread. Waiters that don't
+    process events need replies delivered directly from the sending thread """
+    if params.waiter == 'semaphore':
+        return QtCore.Qt.DirectConnection
+    return QtCore.Qt.AutoConnection
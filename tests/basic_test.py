@@ -1,8 +1,13 @@
 """ Test the pqthreads container module """
 
+import asyncio
+import threading
 import pytest
 from pqthreads.examples import window
 from pqthreads.examples import worker
+from pqthreads import containers
+from pqthreads import futures
+from pqthreads import refs
 from pqthreads.config import params
 from pqthreads.qt import QtCore, QtWidgets
 
@@ -173,3 +178,355 @@ def test_set_application_attribute():
     finally:
         params.set_application_attribute(QtCore.Qt.ApplicationAttribute.AA_ShareOpenGLContexts, on=False)
         QtWidgets.QApplication.setAttribute(QtCore.Qt.ApplicationAttribute.AA_ShareOpenGLContexts, on=False)
+
+
+def test_non_blocking_calls():
+    """ Test that non-blocking calls are processed before the next blocking call """
+
+    params.blocking_calls = False
+
+    try:
+        @worker.decorator_example
+        def main():
+            """ Helper function """
+            fig = worker.figure()
+            result = fig.change_title('First title')
+            fig.title = 'Hello from worker'
+            title = fig.title
+            fig.close()
+            return result, title
+
+        result = main()
+        assert result == (None, 'Figure 1: Hello from worker')
+    finally:
+        params.blocking_calls = True
+
+
+def test_non_blocking_gui_exception():
+    """ Test that exceptions of non-blocking calls are raised at worker exit """
+
+    params.blocking_calls = False
+
+    try:
+        @worker.decorator_example
+        def main():
+            """ Helper function """
+            fig = worker.figure()
+            fig.raise_exception()
+
+        with pytest.raises(window.FigureWindowException):
+            main()
+    finally:
+        params.blocking_calls = True
+
+
+def test_batch():
+    """ Test batched calls and their future results """
+
+    @worker.decorator_example
+    def main():
+        """ Helper function """
+        container = refs.worker.get('figure')
+        fig1 = worker.figure()
+        fig2 = worker.figure()
+        with container.batch():
+            fig1.title = 'First'
+            result = fig2.change_title('Second')
+            title = fig1.title
+            assert not title.done()
+        fig1.close()
+        fig2.close()
+        return title.result(), result.result()
+
+    result = main()
+    assert result == ('Figure 1: First', 'Figure 2: Second')
+
+
+def test_batch_early_result():
+    """ Test that requesting a result inside a batch sends the recorded calls """
+
+    @worker.decorator_example
+    def main():
+        """ Helper function """
+        fig = worker.figure()
+        with refs.worker.get('figure').batch():
+            fig.title = 'Hello from worker'
+            title = fig.title.result()
+            fig.close()
+        return title
+
+    result = main()
+    assert result == 'Figure 1: Hello from worker'
+
+
+def test_semaphore_waiter():
+    """ Test round trips with the semaphore waiter """
+
+    params.waiter = 'semaphore'
+
+    try:
+        @worker.decorator_example
+        def main():
+            """ Helper function """
+            fig = worker.figure()
+            fig.title = 'Hello from worker'
+            title = fig.title
+            fig.close()
+            return title
+
+        result = main()
+        assert result == 'Figure 1: Hello from worker'
+    finally:
+        params.waiter = 'eventloop'
+
+
+def test_semaphore_waiter_gui_exception():
+    """ Test exception in GUI thread with the semaphore waiter """
+
+    params.waiter = 'semaphore'
+
+    try:
+        @worker.decorator_example
+        def main():
+            """ Helper function """
+            fig = worker.figure()
+            fig.raise_exception()
+            fig.close()
+
+        with pytest.raises(window.FigureWindowException):
+            main()
+    finally:
+        params.waiter = 'eventloop'
+
+
+def test_futures():
+    """ Test asynchronous calls on multiple items """
+
+    @worker.decorator_example
+    def main():
+        """ Helper function """
+        figs = [worker.figure() for _ in range(3)]
+        titles = [fig.change_title.submit(f'Title {idx}') for idx, fig in enumerate(figs)]
+        requested = [fig.get_async('title') for fig in figs]
+        results = futures.gather(*titles, *requested, timeout=1)
+        for fig in figs:
+            fig.close()
+        return results
+
+    result = main()
+    expected = [f'Figure {idx+1}: Title {idx}' for idx in range(3)]
+    assert result == expected + expected
+
+
+def test_future_exception():
+    """ Test that GUI exceptions of asynchronous calls are raised by the future """
+
+    @worker.decorator_example
+    def main():
+        """ Helper function """
+        fig = worker.figure()
+        future = fig.raise_exception.submit()
+        try:
+            future.result(timeout=1)
+        except window.FigureWindowException:
+            return True
+        finally:
+            fig.close()
+        return False
+
+    assert main() is True
+
+
+def test_coroutine_function():
+    """ Test awaitable descriptors in a decorated coroutine function """
+
+    @worker.decorator_example
+    async def main():
+        """ Helper function """
+        fig = worker.figure()
+        title = await fig.change_title('Hello from worker')
+        fig.title = 'Another title'
+        results = await asyncio.gather(fig.title, fig.change_title('Last title'))
+        fig.close()
+        return title, results
+
+    title, results = main()
+    assert title == 'Figure 1: Hello from worker'
+    assert results == ['Figure 1: Another title', 'Figure 1: Last title']
+
+
+def test_concurrent_coroutines():
+    """ Test coroutines that share the worker thread while awaiting GUI calls """
+
+    async def update(fig, count):
+        """ Helper coroutine """
+        for idx in range(count):
+            await fig.change_title(f'Update {idx}')
+            await asyncio.sleep(0)
+        return await fig.title
+
+    @worker.decorator_example
+    async def main():
+        """ Helper function """
+        figs = [worker.figure() for _ in range(3)]
+        results = await asyncio.gather(*(update(fig, 5) for fig in figs))
+        for fig in figs:
+            fig.close()
+        return results
+
+    result = main()
+    assert result == [f'Figure {idx+1}: Update 4' for idx in range(3)]
+
+
+def test_concurrent_workers():
+    """ Test multiple worker threads that share the GUI containers """
+
+    barrier = threading.Barrier(3, timeout=5)
+
+    def update(count):
+        """ Helper function """
+        fig = worker.figure()
+        for idx in range(count):
+            fig.change_title(f'Update {idx}')
+        title = fig.title
+        barrier.wait()
+        fig.close()
+        return title
+
+    results = worker.decorator_example.concurrent(*((update, (10,), {}) for _ in range(3)))
+    assert len(results) == 3
+    assert all(result.endswith(': Update 9') for result in results)
+
+
+def test_concurrent_worker_exception():
+    """ Test that an exception in one of multiple worker threads is raised """
+
+    def fail():
+        """ Helper function """
+        fig = worker.figure()
+        fig.raise_worker_exception()
+
+    def succeed():
+        """ Helper function """
+        fig = worker.figure()
+        fig.close()
+
+    with pytest.raises(worker.FigureWorkerException):
+        worker.decorator_example.concurrent(succeed, fail)
+
+
+def test_many_attributes():
+    """ Test getting and setting multiple attributes at once """
+
+    @worker.decorator_example
+    def main():
+        """ Helper function """
+        fig = worker.figure()
+        fig.set_many(title='Hello from worker', opacity=0.5)
+        values = fig.get_many('opacity', 'title')
+        snapshot = fig.snapshot()
+        fig.close()
+        return values, snapshot
+
+    values, snapshot = main()
+    assert values == [pytest.approx(0.5, abs=0.01), 'Figure 1: Hello from worker']
+    assert snapshot == {'title': 'Figure 1: Hello from worker',
+                        'opacity': pytest.approx(0.5, abs=0.01),
+                        'tag': None}
+
+
+def test_many_attributes_unknown():
+    """ Test that only declared attributes can be set at once """
+
+    @worker.decorator_example
+    def main():
+        """ Helper function """
+        fig = worker.figure()
+        try:
+            fig.set_many(unknown=True)
+        finally:
+            fig.close()
+
+    with pytest.raises(AttributeError):
+        main()
+
+
+def test_cached_attribute():
+    """ Test worker side caching of attribute values """
+
+    @worker.decorator_example
+    def main():
+        """ Helper function """
+        container = refs.worker.get('figure')
+        fig = worker.figure(tag='first')
+        tags = [fig.tag, fig.tag]
+        fig.tag = 'second'
+        tags.append(fig.tag)
+        stats = container.cache_stats()
+        fig.raise_window()
+        tags.append(fig.tag)
+        fig.invalidate('tag')
+        tags.append(fig.tag)
+        fig.close()
+        return tags, stats, container.cache_stats()
+
+    tags, stats, final_stats = main()
+    assert tags == ['first', 'first', 'second', 'second', 'second']
+    assert stats == {'hits': 2, 'misses': 1}
+    assert final_stats == {'hits': 2, 'misses': 3}
+
+
+def test_gui_container_indices():
+    """ Test item lookup after deleting items from the GUI container """
+
+    @worker.decorator_example
+    def main():
+        """ Helper function """
+        figs = [worker.figure() for _ in range(3)]
+        figs[0].close()
+        fig = worker.figure()
+        titles = [figs[2].change_title('Third'), fig.change_title('Fourth')]
+        figs[1].close()
+        figs[2].close()
+        fig.close()
+        return titles
+
+    titles = main()
+    assert titles == ['Figure 3: Third', 'Figure 4: Fourth']
+
+
+def test_gui_container_stale_index():
+    """ Test that calls with indices of deleted items are detected """
+
+    @worker.decorator_example
+    def main():
+        """ Helper function """
+        fig = worker.figure()
+        index = fig.index
+        fig.close()
+        worker.figure()
+        refs.worker.get('figure').item_class.agent.method(index, 'raise_window')
+
+    with pytest.raises(containers.ItemException, match='Stale index'):
+        main()
+
+
+def test_worker_container():
+    """ Test lookup, iteration and bulk closure of worker items """
+
+    @worker.decorator_example
+    def main():
+        """ Helper function """
+        container = refs.worker.get('figure')
+        figs = [worker.figure(title=f'Title {idx}') for idx in range(5)]
+        container.close_many(figs[:2])
+        indices = [fig.index for fig in container]
+        title = container.get(figs[3].index).title
+        container.close_all()
+        return indices, title, container.count, str(container)
+
+    indices, title, count, representation = main()
+    assert indices == [2, 3, 4]
+    assert title == 'Figure 4: Title 3'
+    assert count == 0
+    assert representation == '[]'